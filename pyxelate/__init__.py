@@ -1 +1 @@
-from pyxelate.universe import Size, Rule, RuleList, Universe, Simulator
+from .universe import Size, Rule, RuleList, Universe, Simulator
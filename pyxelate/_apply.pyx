@@ -0,0 +1,107 @@
+# cython: language_level=3
+cimport cython
+from cython.parallel import prange
+
+import numpy as np
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef void refresh_padded(unsigned char[:, :] padded, const unsigned char[:, :] cells,
+                         Py_ssize_t vertical_padding, Py_ssize_t horizontal_padding, bint wrap) noexcept nogil:
+    """
+    Copy the cells into the interior of the padded buffer and, if wrap, the opposite edges
+        of the cells into its border; otherwise the border is left as it is
+    """
+    cdef Py_ssize_t height = cells.shape[0]
+    cdef Py_ssize_t width = cells.shape[1]
+    cdef Py_ssize_t r, c
+
+    for r in range(padded.shape[0]):
+        for c in range(padded.shape[1]):
+            if vertical_padding <= r < vertical_padding + height and horizontal_padding <= c < horizontal_padding + width:
+                padded[r, c] = cells[r - vertical_padding, c - horizontal_padding]
+            elif wrap:
+                # C division truncates, so offset the remainders to be non-negative
+                padded[r, c] = cells[((r - vertical_padding) % height + height) % height,
+                                     ((c - horizontal_padding) % width + width) % width]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def apply_rules_2d(unsigned char[:, :] padded, unsigned char[:, :] out, list rules,
+                   bint wrap=False, Py_ssize_t steps=1):
+    """
+    Compute the generations of a 2D universe under arbitrary rules, stopping at the first
+        matching rule for each cell
+    :param padded: the universe surrounded by a border at least as wide as the largest rule
+                   window, the same on opposite sides; holds the cells outside the universe
+                   and is overwritten with each intermediate generation
+    :param out: buffer for the last generation, already holding the current generation so
+                that cells matching no rule keep their state
+    :param rules: the rules to apply
+    :param wrap: whether opposite edges of the universe are neighbours; otherwise the border
+                 of padded is left as it is between generations
+    :param steps: number of generations to compute
+    :return: None
+    """
+    cdef Py_ssize_t num_rules = len(rules)
+    cdef Py_ssize_t height = out.shape[0]
+    cdef Py_ssize_t width = out.shape[1]
+    cdef Py_ssize_t vertical_padding = (padded.shape[0] - height) // 2
+    cdef Py_ssize_t horizontal_padding = (padded.shape[1] - width) // 2
+    cdef Py_ssize_t step, i, j, k, r, c, top, left
+    cdef bint matched
+
+    if height == 0 or width == 0:
+        return
+
+    # copy the rules into flat typed buffers so that the loops below touch no Python objects
+    # and can run without the GIL
+    max_height = max((rule.window.shape[0] for rule in rules), default=1)
+    max_width = max((rule.window.shape[1] for rule in rules), default=1)
+    windows_array = np.zeros((num_rules, max_height, max_width), dtype=np.uint8)
+    shapes_array = np.zeros((num_rules, 4), dtype=np.intp)
+    becomes_array = np.zeros(num_rules, dtype=np.uint8)
+    matchable_array = np.zeros(num_rules, dtype=np.uint8)
+    for k, rule in enumerate(rules):
+        window = np.asarray(rule.window)
+        shapes_array[k] = (window.shape[0], window.shape[1], rule.center[0], rule.center[1])
+        windows_array[k, :window.shape[0], :window.shape[1]] = window
+        becomes_array[k] = rule.becomes
+        # windows holding anything but dead and alive cells can never match
+        matchable_array[k] = np.all((window == 0) | (window == 1))
+
+    cdef const unsigned char[:, :, :] windows = windows_array
+    cdef const Py_ssize_t[:, :] shapes = shapes_array
+    cdef const unsigned char[:] becomes = becomes_array
+    cdef const unsigned char[:] matchable = matchable_array
+
+    for step in range(steps):
+        # out holds the generation padded was last refreshed from, which is also the next
+        # state of every cell matching no rule
+        if step > 0:
+            refresh_padded(padded, out, vertical_padding, horizontal_padding, wrap)
+
+        # every cell reads only the padded input and writes only itself, so rows are split
+        # across OpenMP threads without synchronisation
+        for i in prange(height, nogil=True, schedule='static'):
+            for j in range(width):
+                for k in range(num_rules):
+                    if not matchable[k]:
+                        continue
+                    top = i + vertical_padding - shapes[k, 2]
+                    left = j + horizontal_padding - shapes[k, 3]
+                    matched = True
+                    for r in range(shapes[k, 0]):
+                        for c in range(shapes[k, 1]):
+                            if padded[top + r, left + c] != windows[k, r, c]:
+                                matched = False
+                                break
+                        if not matched:
+                            break
+                    if matched:
+                        out[i, j] = becomes[k]
+                        break
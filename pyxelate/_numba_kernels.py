@@ -0,0 +1,49 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True, boundscheck=False, nogil=True)
+def step_life(grid: np.ndarray, out: np.ndarray, wrap: bool, steps: int) -> None:
+    """
+    Advance a 2D Game of Life steps generations, alternating between the two buffers, so
+        that the last generation is in out if steps is odd and in grid otherwise
+    :param grid: the current generation
+    :param out: buffer for the next generation, with the same shape as grid
+    :param wrap: whether opposite edges are neighbours; otherwise cells outside are dead
+    :param steps: number of generations to advance
+    :return: None
+    """
+    height, width = grid.shape
+    for _ in range(steps):
+        for i in prange(height):
+            for j in range(width):
+                n = 0
+                for r in range(i - 1, i + 2):
+                    for c in range(j - 1, j + 2):
+                        if wrap:
+                            n += grid[r % height, c % width]
+                        elif 0 <= r < height and 0 <= c < width:
+                            n += grid[r, c]
+                n -= grid[i, j]
+                out[i, j] = 1 if n == 3 or (grid[i, j] == 1 and n == 2) else 0
+        grid, out = out, grid
+
+
+@njit(parallel=True, cache=True, boundscheck=False, nogil=True)
+def step_rule110(row: np.ndarray, out: np.ndarray, wrap: bool, steps: int) -> None:
+    """
+    Advance a 1D universe steps generations of elementary rule 110, alternating between the
+        two buffers, so that the last generation is in out if steps is odd and in row otherwise
+    :param row: the current generation
+    :param out: buffer for the next generation, with the same shape as row
+    :param wrap: whether the ends of the row are neighbours; otherwise cells outside are dead
+    :param steps: number of generations to advance
+    :return: None
+    """
+    width = row.shape[0]
+    for _ in range(steps):
+        for j in prange(width):
+            left = row[j - 1] if j > 0 else (row[width - 1] if wrap else 0)
+            right = row[j + 1] if j < width - 1 else (row[0] if wrap else 0)
+            out[j] = (110 >> (4 * left + 2 * row[j] + right)) & 1
+        row, out = out, row
@@ -1,43 +1,46 @@
-from itertools import permutations
+from typing import Tuple
 
 import numpy as np
 
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from .universe import Size, Rule, RuleList, Universe, Simulator
 
-from pyxelate import Size, Rule, RuleList, Universe, Simulator
 
+def _life_states() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Enumerate every 3x3 neighbourhood with the next state of its center cell
+    :return: the 512 neighbourhoods, the one at index i holding bit j of i in cell j of the
+             flattened window, and their next states
+    """
+    bits = ((np.arange(512)[:, None] >> np.arange(9)) & 1).astype(np.uint8)
+    is_cell_alive = bits[:, 4] == 1
+    num_alive_neighbours = bits.sum(axis=1) - is_cell_alive
+    becomes = (num_alive_neighbours == 3) | (is_cell_alive & (num_alive_neighbours == 2))
+    return bits.reshape(512, 3, 3), becomes.astype(np.uint8)
 
-def get_life_rule_list() -> RuleList:
-    from itertools import chain, combinations
 
-    def powerset(iterable):
-        s = list(iterable)
-        return chain.from_iterable(combinations(s, r) for r in range(len(s) + 1))
+def get_life_rule_list() -> RuleList:
+    states, becomes = _life_states()
 
+    # only the neighbourhoods whose center cell changes need a rule
     life = RuleList()
-
-    states = []
-    for subset in powerset(range(9)):
-        state = np.zeros(9)
-        for i in subset:
-            state[i] = 1
-        states.append(state.reshape(3, 3))
-
-    for state in states:
-        is_cell_alive = state[1, 1] == 1
-        num_alive_neighbours = np.sum(state) - int(is_cell_alive)
-        if is_cell_alive and num_alive_neighbours < 2:
-            life.add_rule(Rule(state, (1, 1), 0))
-        elif is_cell_alive and num_alive_neighbours > 3:
-            life.add_rule(Rule(state, (1, 1), 0))
-        elif not is_cell_alive and num_alive_neighbours == 3:
-            life.add_rule(Rule(state, (1, 1), 1))
+    for index in np.flatnonzero(becomes != states[:, 1, 1]):
+        life.add_rule(Rule(states[index], (1, 1), int(becomes[index])))
 
     return life
 
 
+def get_life_lut() -> np.ndarray:
+    """
+    Get the next state of the center cell for each 3x3 neighbourhood, indexed by the
+        neighbourhood with cell i of the flattened window as bit i
+    :return: the 512-entry lookup table
+    """
+    return _life_states()[1]
+
+
+LUT = get_life_lut()
+
+
 def life_sim(size: int = 20) -> None:
     life_rules = get_life_rule_list()
     universe = Universe(dimensions=2, size=Size(size))
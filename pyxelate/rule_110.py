@@ -1,10 +1,6 @@
 import numpy as np
 
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-
-from pyxelate import Size, Rule, RuleList, Universe, Simulator
+from .universe import Size, Rule, RuleList, Universe, Simulator
 
 
 def rule_110_sim(size: int = 50) -> None:
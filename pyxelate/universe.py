@@ -1,9 +1,251 @@
 from copy import copy
-from typing import List, Tuple, Union, Iterator, Iterable
+from functools import partial
+from typing import Callable, List, Tuple, Union, Iterator, Iterable
 
 
 import numpy as np
 
+try:
+    from ._apply import apply_rules_2d as _apply_rules_2d
+except ImportError:
+    # the compiled extension is optional; without it the generic 2D path runs in Python
+    _apply_rules_2d = None
+
+
+# weight of each cell of a 3x3 (Moore) neighbourhood when packed into a 9-bit index
+_MOORE_WEIGHTS = (1 << np.arange(9)).reshape(3, 3)
+
+# boundary conditions a universe can have: cells outside are dead, or opposite edges are neighbours
+_BOUNDARIES = ('zero', 'wrap')
+
+# birth and survival neighbour counts of Conway's Game of Life (B3/S23)
+_LIFE = (frozenset({3}), frozenset({2, 3}))
+
+# side of the square tiles the 2D table and convolution paths are computed over; a tile,
+# its border and the intermediate arrays fit comfortably in L1
+_TILE_SIZE = 64
+
+_WORD_BITS = 64
+# largest rule window whose cells are packed into a single integer for matching
+_MAX_PACKED_CELLS = _WORD_BITS
+_ONE = np.uint64(1)
+_HIGH_BIT = np.uint64(_WORD_BITS - 1)
+
+
+def _numba_kernel(name: str) -> Union[Callable, None]:
+    """
+    Get a Numba kernel, importing numba only once a universe is about to be stepped with it
+    :param name: name of the kernel in _numba_kernels
+    :return: the kernel, or None if numba is not installed
+    """
+    try:
+        from . import _numba_kernels
+    except ImportError:
+        # numba is optional; without it known rules are stepped like any other rule list
+        return None
+    return getattr(_numba_kernels, name)
+
+
+def _moore_lut(rules: 'RuleList') -> Union[np.ndarray, None]:
+    """
+    Build the next state of the center cell for each of the 512 3x3 neighbourhoods,
+        indexed by the neighbourhood packed with _MOORE_WEIGHTS. Neighbourhoods that
+        match no rule keep their center cell, and earlier rules take precedence
+    :param rules: the rules to tabulate
+    :return: the lookup table, or None if any rule is not a 3x3 window centered at (1, 1)
+    """
+    indices = np.arange(512)
+    lut = (indices >> 4) & 1
+    matched = np.zeros(512, dtype=bool)
+    for rule in rules:
+        if rule._shape != (3, 3) or rule.center != (1, 1):
+            return None
+        index = rule._packed
+        if index is None:
+            continue
+        if not matched[index]:
+            lut[index] = rule.becomes
+            matched[index] = True
+    return lut
+
+
+def _elementary_rule_number(rules: 'RuleList') -> Union[int, None]:
+    """
+    Find the Wolfram code of 1D rules, whose bit 4 * left + 2 * center + right is the next
+        state of a cell with those neighbours. Neighbourhoods that match no rule keep their
+        center cell, and earlier rules take precedence
+    :param rules: the rules to tabulate
+    :return: the rule number, or None if any rule is not a 3-cell window centered at 1
+    """
+    next_states = [(index >> 1) & 1 for index in range(8)]
+    matched = [False] * 8
+    for rule in rules:
+        if rule._shape != (3,) or rule.center != (1,):
+            return None
+        if rule._packed is None:
+            continue
+        # the packed window holds the left cell in its lowest bit, the reverse of the rule number
+        left, center, right = rule._packed & 1, (rule._packed >> 1) & 1, rule._packed >> 2
+        index = 4 * left + 2 * center + right
+        if not matched[index]:
+            next_states[index] = int(rule.becomes)
+            matched[index] = True
+    return sum(state << index for index, state in enumerate(next_states))
+
+
+def _totalistic_rule(lut: np.ndarray) -> Union[Tuple[frozenset, frozenset], None]:
+    """
+    Find the birth and survival neighbour counts of a Moore lookup table, if the next
+        state depends only on the center cell and its number of alive neighbours
+    :param lut: lookup table built by _moore_lut
+    :return: the birth and survival counts, or None if the table is not totalistic
+    """
+    bits = (np.arange(512)[:, None] >> np.arange(9)) & 1
+    alive = bits[:, 4]
+    neighbours = bits.sum(axis=1) - alive
+
+    birth, survive = set(), set()
+    for state, counts in ((0, birth), (1, survive)):
+        for count in range(9):
+            outcomes = lut[(alive == state) & (neighbours == count)]
+            if np.any(outcomes != outcomes[0]):
+                return None
+            if outcomes[0] == 1:
+                counts.add(count)
+    return frozenset(birth), frozenset(survive)
+
+
+def _pack_bits(cells: np.ndarray) -> np.ndarray:
+    """
+    Pack cells along the last axis into uint64 words, cell i being bit i % 64 of word i // 64
+    :param cells: dead (0) and alive (1) cells
+    :return: the packed words
+    """
+    packed = np.packbits(cells.astype(bool), axis=-1, bitorder='little')
+    num_bytes = -(-cells.shape[-1] // _WORD_BITS) * (_WORD_BITS // 8)
+    padding = [(0, 0)] * (cells.ndim - 1) + [(0, num_bytes - packed.shape[-1])]
+    return np.ascontiguousarray(np.pad(packed, padding)).view('<u8').astype(np.uint64)
+
+
+def _unpack_bits(words: np.ndarray, width: int) -> np.ndarray:
+    """
+    Inverse of _pack_bits
+    :param words: the packed words
+    :param width: number of cells along the last axis
+    :return: the dead (0) and alive (1) cells
+    """
+    return np.unpackbits(words.astype('<u8').view(np.uint8), axis=-1, count=width, bitorder='little')
+
+
+def _west_neighbours(words: np.ndarray, wrap_width: Union[int, None] = None) -> np.ndarray:
+    """
+    Move every packed cell one position up, so bit i holds what was cell i - 1
+    :param words: the packed words
+    :param wrap_width: if provided, the number of cells, and the first cell receives the last
+                       one; otherwise it receives a dead cell
+    :return: the shifted words
+    """
+    shifted = words << _ONE
+    shifted[..., 1:] |= words[..., :-1] >> _HIGH_BIT
+    if wrap_width is not None:
+        shifted[..., 0] |= (words[..., -1] >> np.uint64((wrap_width - 1) % _WORD_BITS)) & _ONE
+    return shifted
+
+
+def _east_neighbours(words: np.ndarray, wrap_width: Union[int, None] = None) -> np.ndarray:
+    """
+    Move every packed cell one position down, so bit i holds what was cell i + 1
+    :param words: the packed words
+    :param wrap_width: if provided, the number of cells, and the last cell receives the first
+                       one; otherwise it receives a dead cell
+    :return: the shifted words
+    """
+    shifted = words >> _ONE
+    shifted[..., :-1] |= words[..., 1:] << _HIGH_BIT
+    if wrap_width is not None:
+        shifted[..., -1] |= (words[..., 0] & _ONE) << np.uint64((wrap_width - 1) % _WORD_BITS)
+    return shifted
+
+
+def _tail_mask(width: int) -> np.uint64:
+    """
+    Get the mask of the bits of the last packed word that hold cells
+    :param width: number of cells along the packed axis
+    :return: the mask
+    """
+    used = (width - 1) % _WORD_BITS + 1
+    return np.uint64((1 << used) - 1)
+
+
+def _life_step_bitpacked(words: np.ndarray, width: int, wrap: bool = False) -> np.ndarray:
+    """
+    Advance a packed 2D Game of Life one generation. The eight neighbour planes are summed
+        64 cells at a time into the bit-sliced count (s3 s2 s1 s0) with a chain of half adders
+    :param words: the rows of the universe packed by _pack_bits
+    :param width: number of cells in a row
+    :param wrap: whether opposite edges are neighbours; otherwise cells outside are dead
+    :return: the packed next generation
+    """
+    if width == 0:
+        return words.copy()
+
+    if wrap:
+        above = np.roll(words, 1, axis=0)
+        below = np.roll(words, -1, axis=0)
+    else:
+        above = np.zeros_like(words)
+        above[1:] = words[:-1]
+        below = np.zeros_like(words)
+        below[:-1] = words[1:]
+
+    wrap_width = width if wrap else None
+    s0, s1, s2, s3 = (np.zeros_like(words) for _ in range(4))
+    for plane in (above, below, _west_neighbours(words, wrap_width), _east_neighbours(words, wrap_width),
+                  _west_neighbours(above, wrap_width), _east_neighbours(above, wrap_width),
+                  _west_neighbours(below, wrap_width), _east_neighbours(below, wrap_width)):
+        carry = s0 & plane
+        s0 ^= plane
+        carry, s1 = s1 & carry, s1 ^ carry
+        carry, s2 = s2 & carry, s2 ^ carry
+        s3 |= carry
+
+    # alive next generation iff the count is 3, or the count is 2 and the cell is alive
+    new_words = s1 & ~s2 & ~s3 & (s0 | words)
+    new_words[..., -1] &= _tail_mask(width)
+    return new_words
+
+
+def _elementary_step_bitpacked(words: np.ndarray, width: int, rule_number: int, wrap: bool = False) -> np.ndarray:
+    """
+    Advance a packed 1D universe one generation of an elementary rule. Every neighbourhood
+        the rule maps to an alive cell is matched 64 cells at a time and the matches are combined
+    :param words: the row packed by _pack_bits
+    :param width: number of cells in the row
+    :param rule_number: the Wolfram code of the rule
+    :param wrap: whether the ends of the row are neighbours; otherwise cells outside are dead
+    :return: the packed next generation
+    """
+    if width == 0:
+        return words.copy()
+
+    wrap_width = width if wrap else None
+    left = _west_neighbours(words, wrap_width)
+    right = _east_neighbours(words, wrap_width)
+
+    if rule_number == 110:
+        # a cell is alive next generation iff it differs from its right neighbour, or it is
+        # alive and its left neighbour is dead
+        new_words = (words ^ right) | (words & ~left)
+    else:
+        new_words = np.zeros_like(words)
+        for index in range(8):
+            if (rule_number >> index) & 1:
+                new_words |= ((left if index & 4 else ~left) &
+                              (words if index & 2 else ~words) &
+                              (right if index & 1 else ~right))
+    new_words[..., -1] &= _tail_mask(width)
+    return new_words
+
 
 class Size:
     def __init__(self, size: Union[int, None]):
@@ -33,6 +275,7 @@ class Rule:
         """
         if isinstance(center, int):
             center = (center,)
+        center = tuple(center)
         if len(center) != len(window.shape):
             raise ValueError("Center must have the same dimensions as the window")
 
@@ -40,6 +283,15 @@ class Rule:
         self.center = center
         self.becomes = becomes
 
+        # descriptors of the window precomputed for matching; windows of dead and alive
+        # cells small enough are packed into an integer with cell i of the flattened window
+        # as bit i, so that they can be compared to packed neighbourhoods in one operation
+        self._shape = window.shape
+        self._window_flat = np.ascontiguousarray(window, dtype=np.uint8).ravel()
+        self._packed = None
+        if np.all((window == 0) | (window == 1)) and window.size <= _MAX_PACKED_CELLS:
+            self._packed = sum(1 << i for i in np.flatnonzero(self._window_flat).tolist())
+
 
 class RuleList:
 
@@ -67,7 +319,8 @@ class RuleList:
 
 class Universe:
 
-    def __init__(self, dimensions: int, size: Union[Size, None] = None, initial: Union[np.ndarray, None] = None):
+    def __init__(self, dimensions: int, size: Union[Size, None] = None, initial: Union[np.ndarray, None] = None,
+                 padding: int = 1, boundary: str = 'zero', use_numba: bool = False):
         """
         Create a (initially static) universe with cells that can be either dead (0) or alive (1)
         :param dimensions: the dimensionality of the universe; can currently only
@@ -76,10 +329,22 @@ class Universe:
                      have to be provided if initial state is provided
         :param initial: the initial state of the universe; if not provided, then all
                         cells start off dead
+        :param padding: number of cells to preallocate around the universe for matching
+                        rule windows; grown as needed for larger windows
+        :param boundary: 'zero' if cells outside the universe are always dead, or 'wrap' if
+                         opposite edges of the universe are neighbours (a torus in 2D)
+        :param use_numba: whether to step Conway's Game of Life and rule 110 with the Numba
+                          kernels if numba is installed; importing numba and compiling the
+                          kernels takes seconds, which only long runs make up for
         """
         Universe.__check_dimensions(dimensions)
         self._dimensions = dimensions
 
+        if boundary not in _BOUNDARIES:
+            raise ValueError(f"Boundary must be one of {', '.join(_BOUNDARIES)}")
+        self._boundary = boundary
+        self._use_numba = use_numba
+
         if (size is None and initial is None) or (size is not None and initial is not None):
             raise ValueError("Exactly one of size or initial must be provided")
 
@@ -90,14 +355,20 @@ class Universe:
             self._size = size
 
             if dimensions == 1:
-                self._universe = np.array([0] * size.size)
+                self._universe = np.zeros(size.size, dtype=np.uint8)
             elif dimensions == 2:
-                self._universe = np.array([[0] * size.size for _ in range(size.size)])
+                self._universe = np.zeros((size.size, size.size), dtype=np.uint8)
         else:
             Universe.__check_initial(initial, dimensions)
-            self._size = initial.shape[0]
+            self._size = Size(initial.shape[0])
+
+            self._universe = np.copy(np.ascontiguousarray(initial, dtype=np.uint8))
 
-            self._universe = np.copy(initial)
+        # buffers reused across generations: the universe surrounded by the cells outside
+        # it, and the next generation of the generic rule matching
+        self._padding = padding
+        self._padded = np.zeros(tuple(n + 2 * padding for n in self._universe.shape), dtype=np.uint8)
+        self._back = np.empty_like(self._universe)
 
     @staticmethod
     def __check_dimensions(dimensions: int) -> None:
@@ -111,14 +382,23 @@ class Universe:
         if len(initial.shape) != dimensions:
             raise ValueError("Initial universe must have the same number of dimensions provided")
         size = initial.shape[0]
-        if not np.all(initial.shape == size):
+        if not np.all(np.array(initial.shape) == size):
             raise ValueError("Initial universe must have the same size across all dimensions")
 
+    @staticmethod
+    def __check_rules(rules: RuleList, dimensions: int) -> None:
+        for rule in rules:
+            if len(rule._shape) != dimensions:
+                raise ValueError("Rules must match the dimensions")
+
     def __repr__(self) -> str:
+        # offsetting each cell by ord('0') gives its digit as an ASCII byte
+        digits = self._universe.astype(np.uint8) + ord('0')
         if self._dimensions == 1:
-            return ''.join(map(str, self._universe))
+            return digits.tobytes().decode('ascii')
         else:
-            return '\n'.join([''.join(map(str, row)) for row in self._universe])
+            lines = np.hstack([digits, np.full((self._size.size, 1), ord('\n'), dtype=np.uint8)])
+            return lines.tobytes()[:-1].decode('ascii')
 
     def transform(self, location: Union[int, Tuple[int, ...], Iterable[int], Iterable[Tuple[int, ...]]], state: int) -> None:
         """
@@ -136,13 +416,22 @@ class Universe:
 
             self._universe[location] = state
         else:
-            for loc in location:
-                if isinstance(loc, int):
-                    loc = (loc,)
-                if len(loc) != self._dimensions:
-                    raise ValueError("Location must have the same number of dimensions as the universe")
+            # gather all locations into one index array, with a row per location
+            try:
+                indices = np.asarray(list(location), dtype=np.intp)
+            except ValueError:
+                raise ValueError("Location must have the same number of dimensions as the universe")
+            if indices.size == 0:
+                return
+            if indices.ndim == 1:
+                indices = indices[:, np.newaxis]
+            if indices.ndim != 2 or indices.shape[1] != self._dimensions:
+                raise ValueError("Location must have the same number of dimensions as the universe")
 
-                self._universe[loc] = state
+            self._universe[tuple(indices.T)] = state
+
+        # the cells were changed in place, so any packed copy is out of date
+        self._packed = None
 
     def apply(self, rules: RuleList) -> None:
         """
@@ -150,36 +439,348 @@ class Universe:
         :param rules: the rules to apply
         :return: None
         """
-        for rule in rules:
-            if len(rule.window.shape) != self._dimensions:
-                raise ValueError("Rules must match the dimensions")
+        self._step_fn(rules)()
 
-        new_universe = np.copy(self._universe)
+    def _step_fn(self, rules: RuleList) -> Callable[..., None]:
+        """
+        Pick the fastest way to apply the rules to this universe, inspecting them only once
+        :param rules: the rules to apply
+        :return: function advancing the universe under the rules by its argument number of
+                 generations, one by default
+        """
+        Universe.__check_rules(rules, self._dimensions)
 
         if self._dimensions == 1:
-            padding = max((rule.window.shape[0] for rule in rules))
-            old_universe = np.pad(self._universe, padding)
-            for index in range(padding, self._size.size + padding):
-                for rule in rules:
-                    center = rule.center[0]
-                    if np.all(old_universe[index - center:index - center + rule.window.shape[0]] == rule.window):
-                        new_universe[index - padding] = rule.becomes
-                        break
+            rule_number = _elementary_rule_number(rules)
+            if rule_number is not None:
+                return self._elementary_step_fn(rule_number)
         else:
-            vertical_padding = max((rule.window.shape[0] for rule in rules))
-            horizontal_padding = max((rule.window.shape[1] for rule in rules))
-            old_universe = np.pad(self._universe, ((vertical_padding, vertical_padding), (horizontal_padding, horizontal_padding)))
-            for row_index in range(vertical_padding, self._size.size + vertical_padding):
-                for col_index in range(horizontal_padding, self._size.size + vertical_padding):
-                    for rule in rules:
-                        vertical_center, horizontal_center = rule.center
-                        if np.all(old_universe[
-                                  row_index - vertical_center:row_index - vertical_center + rule.window.shape[0],
-                                  col_index - horizontal_center:col_index - horizontal_center + rule.window.shape[1]
-                                  ] == rule.window):
-                            new_universe[row_index - vertical_padding, col_index - horizontal_padding] = rule.becomes
-
-        self._universe = new_universe
+            lut = _moore_lut(rules)
+            if lut is not None:
+                return self._lut_step_fn(lut)
+
+        return partial(self._step_rules, list(rules), self._rule_padding(rules))
+
+    def _elementary_step_fn(self, rule_number: int) -> Callable[..., None]:
+        """
+        Pick the fastest way to apply an elementary rule to this universe
+        :param rule_number: the Wolfram code of the rule
+        :return: function advancing the universe under the rule, as returned by _step_fn
+        """
+        if rule_number == 110 and self._use_numba:
+            kernel = _numba_kernel('step_rule110')
+            if kernel is not None:
+                return partial(self._apply_kernel, kernel)
+        return partial(self._apply_elementary_bitpacked, rule_number)
+
+    def _lut_step_fn(self, lut3x3: np.ndarray) -> Callable[..., None]:
+        """
+        Pick the fastest way to apply a 3x3 lookup table to this universe
+        :param lut3x3: the 512-entry lookup table
+        :return: function advancing the universe under the table, as returned by _step_fn
+        """
+        totalistic = _totalistic_rule(lut3x3)
+        if totalistic == _LIFE:
+            if self._use_numba:
+                kernel = _numba_kernel('step_life')
+                if kernel is not None:
+                    return partial(self._apply_kernel, kernel)
+            return self._apply_life_bitpacked
+        elif totalistic is not None:
+            return partial(self._apply_lifelike, *totalistic)
+        else:
+            return partial(self._apply_lut_tiled, lut3x3)
+
+    def apply_into(self, rules: RuleList, out: np.ndarray, scratch_padded: Union[np.ndarray, None] = None) -> None:
+        """
+        Compute the next generation under the evolution rules into preallocated buffers,
+            leaving the universe itself unchanged
+        :param rules: the rules to apply
+        :param out: buffer for the next generation, with the same shape as the universe
+        :param scratch_padded: buffer for the universe surrounded by a border at least as wide
+                               as given by the padding for the rules; with a 'zero' boundary
+                               only its interior is written, so its border must already be
+                               dead. If not provided, the universe's own padded buffer is used
+        :return: None
+        """
+        required = self._rule_padding(rules)
+        if scratch_padded is None:
+            old_universe = self._refresh_padded(required)
+            padding = required
+        else:
+            padding = tuple((padded - size) // 2 for padded, size in zip(scratch_padded.shape, self._universe.shape))
+            if any(p < r for p, r in zip(padding, required)):
+                raise ValueError("Padded buffer is too small for the rules")
+            self._fill_padded(scratch_padded, padding)
+            old_universe = scratch_padded
+
+        self._match_rules(list(rules), out, old_universe, padding)
+
+    def _step_rules(self, rules: List[Rule], padding: Tuple[int, ...], steps: int = 1) -> None:
+        """
+        Advance the universe under arbitrary rules, using its own buffers
+        :param rules: the rules to apply
+        :param padding: the padding for the rules along each axis
+        :param steps: number of generations to advance
+        :return: None
+        """
+        if self._dimensions == 2 and _apply_rules_2d is not None:
+            # the compiled kernel refreshes the padded buffer itself between generations
+            self._back[...] = self._universe
+            _apply_rules_2d(self._refresh_padded(padding), self._back, rules, self._boundary == 'wrap', steps)
+            self._universe, self._back = self._back, self._universe
+            return
+
+        for _ in range(steps):
+            self._match_rules(rules, self._back, self._refresh_padded(padding), padding)
+            self._universe, self._back = self._back, self._universe
+
+    def _match_rules(self, rules: List[Rule], out: np.ndarray, old_universe: np.ndarray,
+                     padding: Tuple[int, ...]) -> None:
+        """
+        Compute the next generation under arbitrary rules, stopping at the first matching
+            rule for each cell
+        :param rules: the rules to apply
+        :param out: buffer for the next generation
+        :param old_universe: the universe surrounded by the cells outside it
+        :param padding: the width of the surrounding cells along each axis
+        :return: None
+        """
+        out[...] = self._universe
+
+        if self._dimensions == 2 and _apply_rules_2d is not None:
+            _apply_rules_2d(old_universe, out, rules)
+            return
+
+        # match every cell against a rule at once, comparing the packed neighbourhood around
+        # each cell to the packed window; earlier rules take precedence, so cells already
+        # assigned are masked out for later rules
+        neighbourhoods = {}
+        assigned = np.zeros(self._universe.shape, dtype=bool)
+        for rule in rules:
+            key = (rule._shape, rule.center)
+            if key not in neighbourhoods:
+                windows = np.lib.stride_tricks.sliding_window_view(old_universe, rule._shape)
+                windows = windows[tuple(slice(p - c, p - c + self._size.size) for p, c in zip(padding, rule.center))]
+                packed = None
+                if rule._window_flat.size <= _MAX_PACKED_CELLS:
+                    weights = (_ONE << np.arange(rule._window_flat.size, dtype=np.uint64)).reshape(rule._shape)
+                    packed = np.tensordot(windows, weights, axes=self._dimensions)
+                neighbourhoods[key] = windows, packed
+
+            windows, packed = neighbourhoods[key]
+            if rule._packed is not None:
+                mask = packed == np.uint64(rule._packed)
+            else:
+                mask = (windows == rule.window).all(axis=tuple(range(-self._dimensions, 0)))
+            mask &= ~assigned
+            out[mask] = rule.becomes
+            assigned |= mask
+
+    def _rule_padding(self, rules: RuleList) -> Tuple[int, ...]:
+        """
+        Get the number of dead cells needed along each axis on every side of the universe
+            for any window of the rules to be matched at any cell
+        :param rules: the rules to apply
+        :return: the padding along each axis
+        """
+        Universe.__check_rules(rules, self._dimensions)
+        return tuple(max(rule._shape[axis] for rule in rules) for axis in range(self._dimensions))
+
+    def _refresh_padded(self, padding: Tuple[int, ...]) -> np.ndarray:
+        """
+        Copy the universe into the interior of its padded buffer, growing the buffer only
+            if it has less padding than requested
+        :param padding: the padding along each axis
+        :return: a view of the buffer with exactly the requested padding
+        """
+        if max(padding) > self._padding:
+            self._padding = max(padding)
+            self._padded = np.zeros(tuple(n + 2 * self._padding for n in self._universe.shape), dtype=np.uint8)
+
+        padded = self._padded[tuple(slice(self._padding - p, self._padding + n + p)
+                                    for p, n in zip(padding, self._universe.shape))]
+        self._fill_padded(padded, padding)
+        return padded
+
+    def _fill_padded(self, padded: np.ndarray, padding: Tuple[int, ...]) -> None:
+        """
+        Copy the universe into the interior of a padded buffer and, with a 'wrap' boundary,
+            the opposite edges of the universe into its border; with a 'zero' boundary the
+            border is left dead
+        :param padded: the padded buffer
+        :param padding: the padding along each axis
+        :return: None
+        """
+        padded[tuple(slice(p, p + n) for p, n in zip(padding, self._universe.shape))] = self._universe
+        if self._boundary != 'wrap' or self._universe.size == 0:
+            # an empty universe has no cells to wrap around, so its border stays dead
+            return
+
+        if any(p > n for p, n in zip(padding, self._universe.shape)):
+            # the border wraps around the universe more than once
+            padded[...] = np.pad(self._universe, [(p, p) for p in padding], mode='wrap')
+            return
+
+        # wrap one axis at a time over the full extent of the axes already wrapped, which
+        # also fills the corners
+        for axis, (p, n) in enumerate(zip(padding, self._universe.shape)):
+            lead = (slice(None),) * axis
+            padded[lead + (slice(0, p),)] = padded[lead + (slice(n, n + p),)]
+            padded[lead + (slice(n + p, n + 2 * p),)] = padded[lead + (slice(p, 2 * p),)]
+
+    def apply_elementary(self, rule_number: int) -> None:
+        """
+        Apply an elementary cellular automaton rule, 64 cells at a time
+        :param rule_number: the Wolfram code of the rule, whose bit 4 * left + 2 * center + right
+                            is the next state of a cell with those neighbours
+        :return: None
+        """
+        if self._dimensions != 1:
+            raise ValueError("Elementary rules can only be applied to one-dimensional universes")
+        if not 0 <= rule_number < 256:
+            raise ValueError("Elementary rule numbers must be between 0 and 255")
+
+        self._elementary_step_fn(rule_number)()
+
+    def _apply_elementary_bitpacked(self, rule_number: int, steps: int = 1) -> None:
+        """
+        Advance the universe under an elementary rule, 64 cells at a time
+        :param rule_number: the Wolfram code of the rule
+        :param steps: number of generations to advance
+        :return: None
+        """
+        words = self._packed_words()
+        for _ in range(steps):
+            words = _elementary_step_bitpacked(words, self._size.size, rule_number, wrap=self._boundary == 'wrap')
+        self._set_packed(words)
+
+    def apply_lut(self, lut3x3: np.ndarray) -> None:
+        """
+        Apply evolution rules given as the next state of the center cell of every 3x3
+            neighbourhood, indexed by the neighbourhood with cell i of the flattened window
+            as bit i (see get_life_lut for an example)
+        :param lut3x3: the 512-entry lookup table
+        :return: None
+        """
+        if self._dimensions != 2:
+            raise ValueError("Lookup tables can only be applied to two-dimensional universes")
+        if lut3x3.shape != (512,):
+            raise ValueError("Lookup table must have an entry for each of the 512 neighbourhoods")
+
+        self._lut_step_fn(lut3x3)()
+
+    def _apply_lut_tiled(self, lut3x3: np.ndarray, steps: int = 1) -> None:
+        """
+        Advance the universe by looking up the packed 3x3 neighbourhood of every cell in a table
+        :param lut3x3: the 512-entry lookup table
+        :param steps: number of generations to advance
+        :return: None
+        """
+        # scipy is slow to import and only needed here, so it is imported on first use
+        import scipy.signal
+
+        def step_tile(tile: np.ndarray) -> np.ndarray:
+            return lut3x3[scipy.signal.correlate2d(tile.astype(np.uint16), _MOORE_WEIGHTS, mode='valid')]
+
+        self._apply_tiled(step_tile, steps)
+
+    def _apply_lifelike(self, birth_set: frozenset, survive_set: frozenset, steps: int = 1) -> None:
+        """
+        Advance the universe under a totalistic rule on the 3x3 neighbourhood
+        :param birth_set: numbers of alive neighbours for which a dead cell becomes alive
+        :param survive_set: numbers of alive neighbours for which an alive cell stays alive
+        :param steps: number of generations to advance
+        :return: None
+        """
+        import scipy.signal
+
+        def step_tile(tile: np.ndarray) -> np.ndarray:
+            cells = tile[1:-1, 1:-1]
+            neighbours = scipy.signal.convolve2d(tile, np.ones((3, 3), dtype=np.int8), mode='valid')
+            neighbours -= cells
+            return (((cells == 1) & np.isin(neighbours, list(survive_set))) |
+                    ((cells == 0) & np.isin(neighbours, list(birth_set))))
+
+        self._apply_tiled(step_tile, steps)
+
+    def _apply_tiled(self, step_tile: Callable[[np.ndarray], np.ndarray], steps: int = 1) -> None:
+        """
+        Compute the generations of a 2D universe one tile at a time, so that each tile and
+            its border of neighbours stay in cache while its next generation is produced
+        :param step_tile: function from a tile surrounded by one cell of its neighbours on
+                          each side to the next generation of the tile
+        :param steps: number of generations to advance
+        :return: None
+        """
+        for _ in range(steps):
+            padded = self._refresh_padded((1, 1))
+            for row in range(0, self._size.size, _TILE_SIZE):
+                for col in range(0, self._size.size, _TILE_SIZE):
+                    tile = padded[row:row + _TILE_SIZE + 2, col:col + _TILE_SIZE + 2]
+                    self._back[row:row + _TILE_SIZE, col:col + _TILE_SIZE] = step_tile(tile)
+            self._universe, self._back = self._back, self._universe
+
+    def _apply_kernel(self, kernel: Callable[[np.ndarray, np.ndarray, bool, int], None], steps: int = 1) -> None:
+        """
+        Advance the universe with a compiled kernel, which runs all the generations itself
+        :param kernel: function advancing its first argument by its fourth argument number of
+                       generations, alternating with its second argument as the other buffer,
+                       with opposite edges neighbours iff its third argument is True
+        :param steps: number of generations to advance
+        :return: None
+        """
+        kernel(self._universe, self._back, self._boundary == 'wrap', steps)
+        # the kernel alternates buffers, so after an odd number of generations the last
+        # one is in the back buffer
+        if steps % 2 == 1:
+            self._universe, self._back = self._back, self._universe
+
+    def _apply_life_bitpacked(self, steps: int = 1) -> None:
+        """
+        Advance the universe under Conway's Game of Life, 64 cells at a time
+        :param steps: number of generations to advance
+        :return: None
+        """
+        words = self._packed_words()
+        for _ in range(steps):
+            words = _life_step_bitpacked(words, self._size.size, wrap=self._boundary == 'wrap')
+        self._set_packed(words)
+
+    @property
+    def _universe(self) -> np.ndarray:
+        """
+        The cells of the universe, one per byte. The bit-packed steppers leave only the packed
+            words up to date, so the cells are unpacked on first access after them
+        :return: the cells
+        """
+        if self._cells is None:
+            self._cells = _unpack_bits(self._packed, self._size.size)
+        return self._cells
+
+    @_universe.setter
+    def _universe(self, cells: np.ndarray) -> None:
+        self._cells = cells
+        self._packed = None
+
+    def _packed_words(self) -> np.ndarray:
+        """
+        Get the cells of the universe packed along the last axis by _pack_bits, packing
+            them only if they changed since last packed
+        :return: the packed words
+        """
+        if self._packed is None:
+            self._packed = _pack_bits(self._cells)
+        return self._packed
+
+    def _set_packed(self, words: np.ndarray) -> None:
+        """
+        Replace the universe with packed cells, deferring unpacking until the cells are needed
+        :param words: the packed words
+        :return: None
+        """
+        self._packed = words
+        self._cells = None
 
 
 class Simulator:
@@ -193,14 +794,18 @@ class Simulator:
         self._universe = universe
         self._rule_list = rule_list
 
+        # the rules are fixed for the lifetime of the simulator, so the way to step them is
+        # picked once here rather than on every step
+        self._step_fn = universe._step_fn(rule_list)
+
     def step(self, num_steps: int = 1) -> None:
         """
         Go forward in the universe num_steps time steps
         :param num_steps: number of steps to advance the Universe
         :return: None
         """
-        for _ in range(num_steps):
-            self._universe.apply(self._rule_list)
+        if num_steps > 0:
+            self._step_fn(num_steps)
 
     def print_universe(self) -> None:
         """
@@ -0,0 +1,54 @@
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CompileError, LinkError
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    # the compiled extension is optional; without Cython the package is installed as pure Python
+    cythonize = None
+
+
+# compile and link flags enabling OpenMP for each compiler type; unlisted compilers get none
+OPENMP_FLAGS = {
+    'unix': (['-fopenmp'], ['-fopenmp']),
+    'mingw32': (['-fopenmp'], ['-fopenmp']),
+    'msvc': (['/openmp'], []),
+}
+
+
+class BuildExt(build_ext):
+    def build_extension(self, ext: Extension) -> None:
+        """
+        Build an extension with OpenMP if the compiler supports it, and serially otherwise
+        :param ext: the extension to build
+        :return: None
+        """
+        compile_args, link_args = OPENMP_FLAGS.get(self.compiler.compiler_type, ([], []))
+        if compile_args or link_args:
+            try:
+                ext.extra_compile_args += compile_args
+                ext.extra_link_args += link_args
+                super().build_extension(ext)
+                return
+            except (CompileError, LinkError):
+                # e.g. Apple clang, which does not support -fopenmp; prange then runs serially
+                ext.extra_compile_args = [arg for arg in ext.extra_compile_args if arg not in compile_args]
+                ext.extra_link_args = [arg for arg in ext.extra_link_args if arg not in link_args]
+        super().build_extension(ext)
+
+
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize([
+        Extension('pyxelate._apply', ['pyxelate/_apply.pyx'], optional=True),
+    ])
+
+
+setup(
+    name='pyxelate',
+    packages=['pyxelate'],
+    install_requires=['numpy', 'scipy'],
+    ext_modules=ext_modules,
+    cmdclass={'build_ext': BuildExt},
+)
@@ -0,0 +1,130 @@
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from pyxelate import Rule, RuleList, Universe
+from pyxelate.life import get_life_rule_list
+
+
+# every stepper must agree with the naive reference on both boundaries, over odd and even
+# numbers of generations, and on sizes that do not divide the 64-cell words and tiles
+BOUNDARIES = ('zero', 'wrap')
+STEPS = (1, 2, 3)
+SIZES = {1: (0, 1, 63, 65, 130), 2: (0, 1, 5, 37, 70)}
+
+
+def _table_rules(table: np.ndarray, shape: Tuple[int, ...], center: Tuple[int, ...]) -> RuleList:
+    """
+    Build a rule list from the next state of the center cell of every neighbourhood, with a
+        rule only for the neighbourhoods whose center changes, so that rule order is irrelevant
+    :param table: next states, indexed by the neighbourhood with cell i of the flattened window as bit i
+    :param shape: shape of the neighbourhoods
+    :param center: center of the neighbourhoods
+    :return: the rule list
+    """
+    rules = RuleList()
+    for index, becomes in enumerate(table):
+        window = np.array([(index >> bit) & 1 for bit in range(int(np.prod(shape)))]).reshape(shape)
+        if window[center] != becomes:
+            rules.add_rule(Rule(window, center if len(center) > 1 else center[0], int(becomes)))
+    return rules
+
+
+def _lifelike_table(birth: Tuple[int, ...], survive: Tuple[int, ...]) -> np.ndarray:
+    table = np.zeros(512, dtype=np.uint8)
+    for index in range(512):
+        alive = (index >> 4) & 1
+        neighbours = bin(index).count('1') - alive
+        table[index] = neighbours in (survive if alive else birth)
+    return table
+
+
+def _elementary_table(rule_number: int) -> np.ndarray:
+    # the Wolfram code holds the next state of (left, center, right) at bit 4 * left + 2 * center + right
+    return np.array([(rule_number >> (4 * (index & 1) + 2 * ((index >> 1) & 1) + (index >> 2))) & 1
+                     for index in range(8)], dtype=np.uint8)
+
+
+_RANDOM_TABLE = np.random.default_rng(0).integers(0, 2, 512).astype(np.uint8)
+
+# rule lists by name: their dimensions and the rules. Life uses the rule list shipped with the package
+RULESETS: Dict[str, Tuple[int, RuleList]] = {
+    'life': (2, get_life_rule_list()),
+    'highlife': (2, _table_rules(_lifelike_table((3, 6), (2, 3)), (3, 3), (1, 1))),
+    'nontotalistic': (2, _table_rules(_RANDOM_TABLE, (3, 3), (1, 1))),
+    'irregular2d': (2, RuleList([Rule(np.array([[1, 0], [1, 1]]), (0, 1), 0),
+                                 Rule(np.array([[0, 0, 1, 1]]), (0, 2), 1),
+                                 Rule(np.array([[1, 0, 0, 0, 0, 1]]), (0, 1), 1)])),
+    'rule110': (1, RuleList([Rule(np.array([0, 0, 1]), 1, 1),
+                             Rule(np.array([1, 0, 1]), 1, 1),
+                             Rule(np.array([1, 1, 1]), 1, 0)])),
+    'rule30': (1, _table_rules(_elementary_table(30), (3,), (1,))),
+    'irregular1d': (1, RuleList([Rule(np.array([1, 1]), 0, 0),
+                                 Rule(np.array([0, 1, 0, 1, 1]), 3, 1),
+                                 Rule(np.array([0]), 0, 1)])),
+}
+
+
+def reference_step(cells: np.ndarray, rules: RuleList, boundary: str) -> np.ndarray:
+    """
+    Compute the next generation one cell at a time, giving each cell the state of the first
+        rule whose window matches around it, or keeping its state if none does
+    """
+    if cells.size == 0:
+        return cells.copy()
+
+    # index of the first rule with each window, by the shape and center of the window
+    first_rules = {}
+    for number, rule in enumerate(rules):
+        windows = first_rules.setdefault((rule.window.shape, tuple(rule.center)), {})
+        windows.setdefault(np.asarray(rule.window, dtype=np.uint8).tobytes(), number)
+
+    rules = list(rules)
+    padding = max(max(rule.window.shape) for rule in rules)
+    padded = np.pad(cells, padding, mode='wrap' if boundary == 'wrap' else 'constant')
+    new_cells = cells.copy()
+    for index in np.ndindex(cells.shape):
+        matches = []
+        for (shape, center), windows in first_rules.items():
+            window = padded[tuple(slice(i + padding - c, i + padding - c + n) for i, c, n in zip(index, center, shape))]
+            if window.tobytes() in windows:
+                matches.append(windows[window.tobytes()])
+        if matches:
+            new_cells[index] = rules[min(matches)].becomes
+    return new_cells
+
+
+def initial(dimensions: int, size: int) -> np.ndarray:
+    return (np.random.default_rng(size).random((size,) * dimensions) < 0.4).astype(np.uint8)
+
+
+@lru_cache(maxsize=None)
+def reference(ruleset: str, boundary: str, size: int) -> List[np.ndarray]:
+    """
+    Get the generations of the naive reference from the initial grid up to max(STEPS)
+    """
+    dimensions, rules = RULESETS[ruleset]
+    generations = [initial(dimensions, size)]
+    for _ in range(max(STEPS)):
+        generations.append(reference_step(generations[-1], rules, boundary))
+    return generations
+
+
+def assert_matches_reference(make_stepper: Callable[[Universe, RuleList], Callable[[int], None]],
+                             ruleset: str, boundary: str, steps: int, sizes: Tuple[int, ...] = None) -> None:
+    """
+    Check that a stepper advances a universe of each size like the naive reference
+    :param make_stepper: function from a universe and the rules to a function advancing the
+                         universe its argument number of generations
+    :param ruleset: name of the rules in RULESETS
+    :param boundary: the boundary of the universes
+    :param steps: number of generations to advance
+    :param sizes: sizes of the universes; SIZES for the dimensions of the rules if not provided
+    """
+    dimensions, rules = RULESETS[ruleset]
+    for size in sizes if sizes is not None else SIZES[dimensions]:
+        universe = Universe(dimensions, initial=initial(dimensions, size), boundary=boundary)
+        make_stepper(universe, rules)(steps)
+        np.testing.assert_array_equal(universe._universe, reference(ruleset, boundary, size)[steps],
+                                      err_msg=f'size {size}')
@@ -0,0 +1,85 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from pyxelate import Size, Universe
+from pyxelate import universe as universe_module
+from pyxelate.universe import _elementary_step_bitpacked, _pack_bits, _unpack_bits
+
+from .reference import BOUNDARIES, RULESETS, STEPS, assert_matches_reference, initial, reference
+
+
+@pytest.mark.parametrize('width', [0, 1, 63, 64, 65, 130])
+def test_pack_bits_round_trip(width: int) -> None:
+    cells = (np.random.default_rng(width).random((3, width)) < 0.4).astype(np.uint8)
+    words = _pack_bits(cells)
+    assert words.shape == (3, -(-width // 64))
+    np.testing.assert_array_equal(_unpack_bits(words, width), cells)
+
+
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+@pytest.mark.parametrize('steps', STEPS)
+def test_life_bitpacked_matches_reference(boundary: str, steps: int) -> None:
+    assert_matches_reference(lambda universe, rules: universe._apply_life_bitpacked, 'life', boundary, steps)
+
+
+def test_elementary_rule_number() -> None:
+    assert universe_module._elementary_rule_number(RULESETS['rule110'][1]) == 110
+    assert universe_module._elementary_rule_number(RULESETS['rule30'][1]) == 30
+    assert universe_module._elementary_rule_number(RULESETS['irregular1d'][1]) is None
+
+
+@pytest.mark.parametrize('wrap', [False, True])
+def test_elementary_bitpacked_every_rule(wrap: bool) -> None:
+    row = (np.random.default_rng(0).random(130) < 0.5).astype(np.uint8)
+    padded = np.pad(row, 1, mode='wrap' if wrap else 'constant')
+    neighbourhoods = 4 * padded[:-2] + 2 * padded[1:-1] + padded[2:]
+    for rule_number in range(256):
+        words = _elementary_step_bitpacked(_pack_bits(row), row.size, rule_number, wrap=wrap)
+        np.testing.assert_array_equal(_unpack_bits(words, row.size), (rule_number >> neighbourhoods) & 1,
+                                      err_msg=f'rule {rule_number}')
+
+
+@pytest.mark.parametrize('ruleset', ['rule110', 'rule30'])
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+@pytest.mark.parametrize('steps', STEPS)
+def test_elementary_bitpacked_matches_reference(ruleset: str, boundary: str, steps: int) -> None:
+    rule_number = universe_module._elementary_rule_number(RULESETS[ruleset][1])
+    assert_matches_reference(lambda universe, rules: partial(universe._apply_elementary_bitpacked, rule_number),
+                             ruleset, boundary, steps)
+
+
+@pytest.mark.parametrize('ruleset', ['life', 'rule110'])
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+def test_packed_state_hands_over(ruleset: str, boundary: str) -> None:
+    # the bit-packed steppers keep their words between generations; stepping another way in
+    # between must see their cells, and they must see that stepper's cells in turn
+    dimensions, rules = RULESETS[ruleset]
+    size = 70 if dimensions == 2 else 130
+    universe = Universe(dimensions, initial=initial(dimensions, size), boundary=boundary)
+    if dimensions == 2:
+        packed = universe._apply_life_bitpacked
+    else:
+        packed = partial(universe._apply_elementary_bitpacked, 110)
+    generic = partial(universe._step_rules, list(rules), universe._rule_padding(rules))
+
+    packed(1)
+    generic(1)
+    packed(1)
+    np.testing.assert_array_equal(universe._universe, reference(ruleset, boundary, size)[3])
+
+
+def test_transform_after_packed_step() -> None:
+    universe = Universe(2, size=Size(70))
+    universe.transform([(10, 10), (10, 11), (10, 12)], state=1)
+    universe._apply_life_bitpacked(1)
+    universe.transform([(40, 64), (40, 65), (41, 64), (41, 65)], state=1)
+    universe._apply_life_bitpacked(3)
+
+    # the blinker is back in its horizontal phase and the block, a still life, is unchanged
+    expected = np.zeros((70, 70), dtype=np.uint8)
+    expected[10, 10:13] = 1
+    expected[40:42, 64:66] = 1
+    np.testing.assert_array_equal(universe._universe, expected)
+    assert repr(universe).count('1') == 7
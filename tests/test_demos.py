@@ -0,0 +1,21 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.mark.parametrize('module', ['pyxelate.life', 'pyxelate.rule_110'])
+def test_demo_runs_as_module(module: str) -> None:
+    result = subprocess.run([sys.executable, '-m', module], check=True, capture_output=True, text=True,
+                            cwd=Path(__file__).parents[1])
+    # the initial universe and ten generations, each followed by a blank line
+    assert result.stdout.count('\n\n') == 11
+
+
+def test_import_leaves_sys_path_alone() -> None:
+    code = ('import sys\n'
+            'path = list(sys.path)\n'
+            'import pyxelate, pyxelate.life, pyxelate.rule_110\n'
+            'assert sys.path == path\n')
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=Path(__file__).parents[1])
@@ -0,0 +1,34 @@
+from functools import partial
+
+import pytest
+
+from pyxelate import Size, Universe
+
+from .reference import BOUNDARIES, RULESETS, assert_matches_reference
+
+
+@pytest.mark.parametrize('ruleset', RULESETS)
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+def test_step_fn_matches_reference(ruleset: str, boundary: str) -> None:
+    assert_matches_reference(lambda universe, rules: universe._step_fn(rules), ruleset, boundary, 1)
+
+
+@pytest.mark.parametrize('ruleset, stepper', [
+    ('life', '_apply_life_bitpacked'),
+    ('highlife', '_apply_lifelike'),
+    ('nontotalistic', '_apply_lut_tiled'),
+    ('irregular2d', '_step_rules'),
+    ('rule110', '_apply_elementary_bitpacked'),
+    ('rule30', '_apply_elementary_bitpacked'),
+    ('irregular1d', '_step_rules'),
+])
+def test_step_fn_picks_stepper(ruleset: str, stepper: str) -> None:
+    dimensions, rules = RULESETS[ruleset]
+    step_fn = Universe(dimensions, size=Size(8))._step_fn(rules)
+    method = step_fn.func if isinstance(step_fn, partial) else step_fn
+    assert method.__name__ == stepper
+
+
+def test_step_fn_rejects_rules_of_other_dimensions() -> None:
+    with pytest.raises(ValueError):
+        Universe(1, size=Size(8))._step_fn(RULESETS['life'][1])
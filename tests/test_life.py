@@ -0,0 +1,30 @@
+import numpy as np
+
+from pyxelate.life import LUT, get_life_lut, get_life_rule_list
+
+
+def _conway(index: int) -> int:
+    # cell i of the flattened 3x3 neighbourhood is bit i of its index, so the center is bit 4
+    alive = (index >> 4) & 1
+    neighbours = bin(index).count('1') - alive
+    return int(neighbours == 3 or (alive and neighbours == 2))
+
+
+def test_life_lut() -> None:
+    expected = [_conway(index) for index in range(512)]
+    np.testing.assert_array_equal(get_life_lut(), expected)
+    np.testing.assert_array_equal(LUT, expected)
+
+
+def test_life_rule_list() -> None:
+    weights = 1 << np.arange(9)
+    indices = set()
+    for rule in get_life_rule_list():
+        assert rule.window.shape == (3, 3) and tuple(rule.center) == (1, 1)
+        index = int(np.asarray(rule.window).flatten() @ weights)
+        assert rule.becomes == _conway(index) != rule.window[1, 1]
+        indices.add(index)
+
+    # exactly the neighbourhoods whose center changes, each once
+    assert indices == {index for index in range(512) if _conway(index) != (index >> 4) & 1}
+    assert len(indices) == len(list(get_life_rule_list()))
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from pyxelate import Size, Universe
+
+from .reference import BOUNDARIES, RULESETS, STEPS, assert_matches_reference
+
+
+@pytest.mark.parametrize('ruleset, kernel', [('life', 'step_life'), ('rule110', 'step_rule110')])
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+@pytest.mark.parametrize('steps', STEPS)
+def test_kernel_matches_reference(ruleset: str, kernel: str, boundary: str, steps: int) -> None:
+    pytest.importorskip('numba')
+    from pyxelate import _numba_kernels
+    assert_matches_reference(lambda universe, rules: partial(universe._apply_kernel, getattr(_numba_kernels, kernel)),
+                             ruleset, boundary, steps)
+
+
+@pytest.mark.parametrize('ruleset', ['life', 'rule110'])
+def test_kernels_are_opt_in(ruleset: str) -> None:
+    pytest.importorskip('numba')
+    dimensions, rules = RULESETS[ruleset]
+    default = Universe(dimensions, size=Size(8))._step_fn(rules)
+    assert getattr(default, 'func', default).__name__ != '_apply_kernel'
+    assert Universe(dimensions, size=Size(8), use_numba=True)._step_fn(rules).func.__name__ == '_apply_kernel'
+
+
+def test_numba_is_not_imported_by_default() -> None:
+    code = ('import sys, io, contextlib\n'
+            'from pyxelate.life import life_sim\n'
+            'from pyxelate.rule_110 import rule_110_sim\n'
+            'with contextlib.redirect_stdout(io.StringIO()):\n'
+            '    life_sim()\n'
+            '    rule_110_sim()\n'
+            'assert "numba" not in sys.modules\n')
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=Path(__file__).parents[1])
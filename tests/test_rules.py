@@ -0,0 +1,107 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from pyxelate import Rule, RuleList, Universe
+from pyxelate import universe as universe_module
+
+from .reference import BOUNDARIES, RULESETS, STEPS, assert_matches_reference, initial, reference, reference_step
+
+
+def _generic_rules(universe: Universe, rules: RuleList) -> partial:
+    return partial(universe._step_rules, list(rules), universe._rule_padding(rules))
+
+
+@pytest.mark.parametrize('ruleset', [name for name, (dimensions, _) in RULESETS.items() if dimensions == 1])
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+@pytest.mark.parametrize('steps', STEPS)
+def test_generic_rules_1d_match_reference(ruleset: str, boundary: str, steps: int) -> None:
+    assert_matches_reference(_generic_rules, ruleset, boundary, steps)
+
+
+@pytest.mark.parametrize('ruleset', [name for name, (dimensions, _) in RULESETS.items() if dimensions == 2])
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+@pytest.mark.parametrize('steps', STEPS)
+def test_cython_rules_match_reference(ruleset: str, boundary: str, steps: int) -> None:
+    if universe_module._apply_rules_2d is None:
+        pytest.skip('the Cython extension is not built')
+    assert_matches_reference(_generic_rules, ruleset, boundary, steps)
+
+
+@pytest.mark.parametrize('ruleset', [name for name, (dimensions, _) in RULESETS.items() if dimensions == 2])
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+@pytest.mark.parametrize('steps', STEPS)
+def test_python_rules_2d_match_reference(ruleset: str, boundary: str, steps: int,
+                                        monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(universe_module, '_apply_rules_2d', None)
+    assert_matches_reference(_generic_rules, ruleset, boundary, steps)
+
+
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+@pytest.mark.parametrize('cython', [False, True])
+def test_unpackable_windows(boundary: str, cython: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    if not cython:
+        monkeypatch.setattr(universe_module, '_apply_rules_2d', None)
+    elif universe_module._apply_rules_2d is None:
+        pytest.skip('the Cython extension is not built')
+
+    # a window holding a state no cell can be in, which therefore never matches, and one of
+    # more cells than fit in one packed integer
+    rules = RuleList([Rule(np.array([[2, 0], [0, 0]]), (0, 0), 0),
+                      Rule(np.zeros((9, 9), dtype=np.uint8), (4, 4), 1)])
+    cells = (np.random.default_rng(1).random((20, 20)) < 0.03).astype(np.uint8)
+    universe = Universe(2, initial=cells, boundary=boundary)
+    _generic_rules(universe, rules)(1)
+    np.testing.assert_array_equal(universe._universe, reference_step(cells, rules, boundary))
+
+
+def _step_into(universe: Universe, rules: RuleList, steps: int, scratch: bool = False) -> None:
+    padding = universe._rule_padding(rules)
+    for _ in range(steps):
+        out = np.empty_like(universe._universe)
+        scratch_padded = None
+        if scratch:
+            scratch_padded = np.zeros(tuple(n + 2 * p for n, p in zip(universe._universe.shape, padding)),
+                                      dtype=np.uint8)
+        universe.apply_into(rules, out, scratch_padded)
+        universe._universe = out
+
+
+@pytest.mark.parametrize('ruleset', RULESETS)
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+@pytest.mark.parametrize('scratch', [False, True])
+def test_apply_into_matches_reference(ruleset: str, boundary: str, scratch: bool) -> None:
+    assert_matches_reference(lambda universe, rules: partial(_step_into, universe, rules, scratch=scratch),
+                             ruleset, boundary, 2)
+
+
+def test_apply_into_leaves_universe_unchanged() -> None:
+    dimensions, rules = RULESETS['irregular2d']
+    universe = Universe(dimensions, initial=initial(dimensions, 37))
+    out = np.empty_like(universe._universe)
+    universe.apply_into(rules, out)
+    np.testing.assert_array_equal(universe._universe, initial(dimensions, 37))
+    np.testing.assert_array_equal(out, reference('irregular2d', 'zero', 37)[1])
+
+
+def test_apply_into_rejects_small_scratch() -> None:
+    dimensions, rules = RULESETS['irregular2d']
+    universe = Universe(dimensions, initial=initial(dimensions, 5))
+    with pytest.raises(ValueError):
+        universe.apply_into(rules, np.empty((5, 5), dtype=np.uint8), np.zeros((7, 7), dtype=np.uint8))
+
+
+def test_padded_buffer_is_reused_and_grown() -> None:
+    dimensions, rules = RULESETS['irregular2d']
+    universe = Universe(dimensions, initial=initial(dimensions, 37), padding=2)
+    step = _generic_rules(universe, rules)
+
+    # the first generation needs a border as wide as the widest window, so the buffer grows
+    step(1)
+    padded = universe._padded
+    assert universe._padding == max(rule.window.shape[1] for rule in rules)
+
+    step(2)
+    assert universe._padded is padded
+    np.testing.assert_array_equal(universe._universe, reference('irregular2d', 'zero', 37)[3])
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from pyxelate import Simulator, Universe
+
+from .reference import BOUNDARIES, RULESETS, STEPS, assert_matches_reference, initial
+
+
+@pytest.mark.parametrize('ruleset', RULESETS)
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+@pytest.mark.parametrize('steps', STEPS)
+def test_fused_steps_match_reference(ruleset: str, boundary: str, steps: int) -> None:
+    assert_matches_reference(lambda universe, rules: Simulator(universe, rules).step, ruleset, boundary, steps)
+
+
+@pytest.mark.parametrize('ruleset', RULESETS)
+def test_fused_steps_match_single_steps(ruleset: str) -> None:
+    dimensions, rules = RULESETS[ruleset]
+    fused = Universe(dimensions, initial=initial(dimensions, 37), boundary='wrap')
+    single = Universe(dimensions, initial=initial(dimensions, 37), boundary='wrap')
+
+    Simulator(fused, rules).step(5)
+    simulator = Simulator(single, rules)
+    for _ in range(5):
+        simulator.step()
+    np.testing.assert_array_equal(fused._universe, single._universe)
+
+
+def test_no_steps() -> None:
+    dimensions, rules = RULESETS['life']
+    universe = Universe(dimensions, initial=initial(dimensions, 37))
+    Simulator(universe, rules).step(0)
+    np.testing.assert_array_equal(universe._universe, initial(dimensions, 37))
@@ -0,0 +1,51 @@
+from functools import partial
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from pyxelate import RuleList, Universe
+from pyxelate import universe as universe_module
+from pyxelate.life import get_life_lut
+
+from .reference import BOUNDARIES, RULESETS, STEPS, assert_matches_reference
+
+
+def _lifelike(universe: Universe, rules: RuleList) -> partial:
+    totalistic = universe_module._totalistic_rule(universe_module._moore_lut(rules))
+    return partial(universe._apply_lifelike, *totalistic)
+
+
+@pytest.mark.parametrize('ruleset', ['life', 'highlife'])
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+@pytest.mark.parametrize('steps', STEPS)
+def test_lifelike_matches_reference(ruleset: str, boundary: str, steps: int) -> None:
+    assert_matches_reference(_lifelike, ruleset, boundary, steps)
+
+
+def _lut(universe: Universe, rules: RuleList) -> partial:
+    return partial(universe._apply_lut_tiled, universe_module._moore_lut(rules))
+
+
+def test_moore_lut_of_life_rules() -> None:
+    np.testing.assert_array_equal(universe_module._moore_lut(RULESETS['life'][1]), get_life_lut())
+    assert universe_module._totalistic_rule(get_life_lut()) == universe_module._LIFE
+
+
+def test_moore_lut_needs_centered_3x3_windows() -> None:
+    assert universe_module._moore_lut(RULESETS['irregular2d'][1]) is None
+    assert universe_module._totalistic_rule(universe_module._moore_lut(RULESETS['nontotalistic'][1])) is None
+
+
+@pytest.mark.parametrize('ruleset', ['life', 'highlife', 'nontotalistic'])
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+@pytest.mark.parametrize('steps', STEPS)
+def test_lut_matches_reference(ruleset: str, boundary: str, steps: int) -> None:
+    assert_matches_reference(_lut, ruleset, boundary, steps)
+
+
+@pytest.mark.parametrize('make_stepper', [_lifelike, _lut], ids=['lifelike', 'lut'])
+@pytest.mark.parametrize('boundary', BOUNDARIES)
+def test_tiles_join_up(make_stepper: Callable[[Universe, RuleList], partial], boundary: str) -> None:
+    # a tile exactly, one cell past it, and one cell past two tiles
+    assert_matches_reference(make_stepper, 'highlife', boundary, 2, sizes=(64, 65, 129))
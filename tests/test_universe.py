@@ -0,0 +1,100 @@
+from typing import Any, List, Tuple, Union
+
+import numpy as np
+import pytest
+
+from pyxelate import Size, Universe
+
+
+@pytest.mark.parametrize('dimensions', [1, 2])
+def test_cells_are_contiguous_uint8(dimensions: int) -> None:
+    for universe in (Universe(dimensions, size=Size(5)),
+                     Universe(dimensions, initial=np.ones((5,) * dimensions, dtype=np.int64))):
+        assert universe._universe.dtype == np.uint8
+        assert universe._universe.flags.c_contiguous
+
+
+def test_initial_is_copied() -> None:
+    initial = np.zeros((4, 4), dtype=np.uint8)
+    universe = Universe(2, initial=initial)
+    initial[0, 0] = 1
+    assert universe._universe[0, 0] == 0
+
+
+def _joined_repr(cells: np.ndarray) -> str:
+    # how universes were rendered before the byte arithmetic
+    if cells.ndim == 1:
+        return ''.join(map(str, cells))
+    return '\n'.join([''.join(map(str, row)) for row in cells])
+
+
+@pytest.mark.parametrize('dimensions', [1, 2])
+@pytest.mark.parametrize('size', [0, 1, 7, 70])
+def test_repr_matches_joined_strings(dimensions: int, size: int) -> None:
+    cells = (np.random.default_rng(size).random((size,) * dimensions) < 0.5).astype(np.uint8)
+    assert repr(Universe(dimensions, initial=cells)) == _joined_repr(cells)
+
+
+def _cells(shape: Tuple[int, ...], alive: List[Union[int, Tuple[int, ...]]]) -> np.ndarray:
+    cells = np.zeros(shape, dtype=np.uint8)
+    for location in alive:
+        cells[location] = 1
+    return cells
+
+
+@pytest.mark.parametrize('location', [
+    3,
+    [3, 5, 7],
+    (i for i in [3, 5, 7]),
+    np.arange(3, 8, 2),
+    [np.int64(3), np.int64(5), np.int64(7)],
+    [(3,), (5,), (7,)],
+], ids=['int', 'list', 'generator', 'array', 'numpy ints', '1-tuples'])
+def test_transform_1d(location: Any) -> None:
+    universe = Universe(1, size=Size(10))
+    universe.transform(location, state=1)
+    expected = [3] if isinstance(location, int) else [3, 5, 7]
+    np.testing.assert_array_equal(universe._universe, _cells((10,), expected))
+
+
+@pytest.mark.parametrize('location', [
+    [(1, 2), (3, 4)],
+    [[1, 2], [3, 4]],
+    ((row, col) for row, col in [(1, 2), (3, 4)]),
+    np.array([[1, 2], [3, 4]]),
+    [(np.int64(1), np.int64(2)), (np.int64(3), np.int64(4))],
+], ids=['tuples', 'lists', 'generator', 'array', 'numpy ints'])
+def test_transform_2d(location: Any) -> None:
+    # every item is the coordinates of one cell, whether a tuple or a list
+    universe = Universe(2, size=Size(6))
+    universe.transform(location, state=1)
+    np.testing.assert_array_equal(universe._universe, _cells((6, 6), [(1, 2), (3, 4)]))
+
+    universe.transform((1, 2), state=0)
+    np.testing.assert_array_equal(universe._universe, _cells((6, 6), [(3, 4)]))
+
+
+@pytest.mark.parametrize('dimensions', [1, 2])
+@pytest.mark.parametrize('location', [[], iter([]), np.empty((0, 2), dtype=int)], ids=['list', 'iterator', 'array'])
+def test_transform_nothing(dimensions: int, location: Any) -> None:
+    universe = Universe(dimensions, initial=np.ones((4,) * dimensions, dtype=np.uint8))
+    universe.transform(location, state=0)
+    np.testing.assert_array_equal(universe._universe, np.ones((4,) * dimensions))
+
+
+@pytest.mark.parametrize('dimensions, location', [
+    (2, 3),
+    (2, ()),
+    (2, (1, 2, 3)),
+    (2, [1, 2]),
+    (2, [(1, 2), (3,)]),
+    (2, [(1, 2, 3)]),
+    (2, [(1, 2), (3, 4, 5)]),
+    (1, (1, 2)),
+    (1, [(1, 2)]),
+], ids=['int in 2d', 'empty tuple', '3-tuple', 'ints in 2d', 'ragged', '3-tuples', 'mismatched', 'tuple in 1d', 'tuples in 1d'])
+def test_transform_wrong_dimensions(dimensions: int, location: Any) -> None:
+    universe = Universe(dimensions, size=Size(6))
+    with pytest.raises(ValueError):
+        universe.transform(location, state=1)
+    np.testing.assert_array_equal(universe._universe, np.zeros((6,) * dimensions))
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from pyxelate import Simulator, Size, Universe
+
+from .reference import RULESETS, initial
+
+
+def test_unknown_boundary() -> None:
+    with pytest.raises(ValueError):
+        Universe(2, size=Size(5), boundary='reflect')
+
+
+@pytest.mark.parametrize('ruleset', RULESETS)
+def test_wrapped_steps_commute_with_rolling(ruleset: str) -> None:
+    # on a torus no cell is special, so shifting the universe and stepping it is the same as
+    # stepping it and shifting the result, including across the wrapped edges
+    dimensions, rules = RULESETS[ruleset]
+    size = 37 if dimensions == 2 else 130
+    shift = (5,) * dimensions
+    axes = tuple(range(dimensions))
+
+    stepped = Universe(dimensions, initial=initial(dimensions, size), boundary='wrap')
+    Simulator(stepped, rules).step(3)
+    rolled = Universe(dimensions, initial=np.roll(initial(dimensions, size), shift, axes), boundary='wrap')
+    Simulator(rolled, rules).step(3)
+
+    np.testing.assert_array_equal(rolled._universe, np.roll(stepped._universe, shift, axes))
+
+
+@pytest.mark.parametrize('size', [8, 70])
+def test_glider_comes_back_around(size: int) -> None:
+    # a glider moves one cell diagonally every four generations
+    universe = Universe(2, size=Size(size), boundary='wrap')
+    universe.transform([(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)], state=1)
+    start = universe._universe.copy()
+    Simulator(universe, RULESETS['life'][1]).step(4 * size)
+    np.testing.assert_array_equal(universe._universe, start)